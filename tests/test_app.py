@@ -2,87 +2,82 @@
 Tests for the Mergington High School Activities API
 """
 
-import sys
-from pathlib import Path
-
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import copy
 
 import pytest
 from fastapi.testclient import TestClient
 from app import app, activities
 
 
-@pytest.fixture
+SIGNUP_URL = "/activities/{}/signup"
+UNREGISTER_URL = "/activities/{}/unregister"
+
+# Initial activity state, built once and deep-copied into `activities` per test
+INITIAL_ACTIVITIES = {
+    "Basketball": {
+        "description": "Team sport focusing on basketball skills and competitive games",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["james@mergington.edu"]
+    },
+    "Soccer": {
+        "description": "Outdoor soccer league and friendly matches",
+        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
+        "max_participants": 22,
+        "participants": ["alex@mergington.edu", "nina@mergington.edu"]
+    },
+    "Art Club": {
+        "description": "Explore painting, drawing, and mixed media techniques",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["grace@mergington.edu"]
+    },
+}
+
+
+def _restore_activities():
+    """Replace activities with a fresh copy of the initial state"""
+    activities.clear()
+    activities.update(copy.deepcopy(INITIAL_ACTIVITIES))
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client for the FastAPI app, shared across the session"""
+    # Entering the client keeps one event-loop portal open for every request;
+    # httpx.ASGITransport is async-only and cannot back a sync httpx.Client
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(autouse=True)
 def reset_activities():
     """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Basketball": {
-            "description": "Team sport focusing on basketball skills and competitive games",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Soccer": {
-            "description": "Outdoor soccer league and friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["alex@mergington.edu", "nina@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore painting, drawing, and mixed media techniques",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["grace@mergington.edu"]
-        },
-    }
-    
-    # Clear and reset activities
-    activities.clear()
-    activities.update(original_activities)
-    
-    yield
-    
-    # Reset again after test
-    activities.clear()
-    activities.update(original_activities)
+    _restore_activities()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
-        """Test that GET /activities returns all available activities"""
+    def test_get_activities_returns_all_activities_with_details(self, client):
+        """Test that GET /activities returns every activity with its fields and participants"""
         response = client.get("/activities")
         assert response.status_code == 200
         data = response.json()
+        
+        # All activities are listed
         assert "Basketball" in data
         assert "Soccer" in data
         assert "Art Club" in data
-    
-    def test_get_activities_contains_activity_details(self, client):
-        """Test that activities have required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        basketball = data["Basketball"]
         
+        # Activities have required fields
+        basketball = data["Basketball"]
         assert "description" in basketball
         assert "schedule" in basketball
         assert "max_participants" in basketball
         assert "participants" in basketball
-    
-    def test_get_activities_shows_participants(self, client):
-        """Test that participant list is included"""
-        response = client.get("/activities")
-        data = response.json()
         
+        # Participant lists are included
         assert "james@mergington.edu" in data["Basketball"]["participants"]
         assert "alex@mergington.edu" in data["Soccer"]["participants"]
 
@@ -93,56 +88,52 @@ class TestSignup:
     def test_signup_for_activity_success(self, client):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Basketball/signup?email=newemail@mergington.edu"
+            SIGNUP_URL.format("Basketball"), params={"email": "newemail@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
-        assert "Signed up" in data["message"]
-        assert "newemail@mergington.edu" in data["message"]
+        assert data["message"] == "Signed up newemail@mergington.edu for Basketball"
     
     def test_signup_adds_participant_to_activity(self, client):
         """Test that signup actually adds the participant"""
         email = "newemail@mergington.edu"
         
         # Signup
-        client.post(f"/activities/Basketball/signup?email={email}")
+        client.post(SIGNUP_URL.format("Basketball"), params={"email": email})
         
         # Verify participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Basketball"]["participants"]
+        assert email in activities["Basketball"]["participants"]
     
     def test_signup_for_nonexistent_activity_returns_404(self, client):
         """Test signup for activity that doesn't exist"""
         response = client.post(
-            "/activities/NonexistentActivity/signup?email=test@mergington.edu"
+            SIGNUP_URL.format("NonexistentActivity"), params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
         data = response.json()
-        assert "Activity not found" in data["detail"]
+        assert data["detail"] == "Activity not found"
     
     def test_signup_duplicate_participant_returns_400(self, client):
         """Test that duplicate signup is rejected"""
         response = client.post(
-            "/activities/Basketball/signup?email=james@mergington.edu"
+            SIGNUP_URL.format("Basketball"), params={"email": "james@mergington.edu"}
         )
         assert response.status_code == 400
         data = response.json()
-        assert "already signed up" in data["detail"]
+        assert data["detail"] == "Student already signed up for this activity"
     
     def test_signup_multiple_participants(self, client):
         """Test signing up multiple different participants"""
         emails = ["user1@mergington.edu", "user2@mergington.edu", "user3@mergington.edu"]
         
         for email in emails:
-            response = client.post(f"/activities/Art Club/signup?email={email}")
+            response = client.post(SIGNUP_URL.format("Art Club"), params={"email": email})
             assert response.status_code == 200
         
         # Verify all were added
-        response = client.get("/activities")
-        data = response.json()
+        participants = activities["Art Club"]["participants"]
         for email in emails:
-            assert email in data["Art Club"]["participants"]
+            assert email in participants
 
 
 class TestUnregister:
@@ -151,58 +142,53 @@ class TestUnregister:
     def test_unregister_success(self, client):
         """Test successful unregistration from an activity"""
         response = client.post(
-            "/activities/Basketball/unregister?email=james@mergington.edu"
+            UNREGISTER_URL.format("Basketball"), params={"email": "james@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
-        assert "Unregistered" in data["message"]
+        assert data["message"] == "Unregistered james@mergington.edu from Basketball"
     
     def test_unregister_removes_participant(self, client):
         """Test that unregister actually removes the participant"""
         email = "james@mergington.edu"
         
         # Unregister
-        client.post(f"/activities/Basketball/unregister?email={email}")
+        client.post(UNREGISTER_URL.format("Basketball"), params={"email": email})
         
         # Verify participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Basketball"]["participants"]
+        assert email not in activities["Basketball"]["participants"]
     
     def test_unregister_from_nonexistent_activity_returns_404(self, client):
         """Test unregister from activity that doesn't exist"""
         response = client.post(
-            "/activities/NonexistentActivity/unregister?email=test@mergington.edu"
+            UNREGISTER_URL.format("NonexistentActivity"), params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
         data = response.json()
-        assert "Activity not found" in data["detail"]
+        assert data["detail"] == "Activity not found"
     
     def test_unregister_non_participant_returns_400(self, client):
         """Test that unregistering a non-participant is rejected"""
         response = client.post(
-            "/activities/Basketball/unregister?email=notregistered@mergington.edu"
+            UNREGISTER_URL.format("Basketball"), params={"email": "notregistered@mergington.edu"}
         )
         assert response.status_code == 400
         data = response.json()
-        assert "not signed up" in data["detail"]
+        assert data["detail"] == "Student is not signed up for this activity"
     
     def test_unregister_then_signup_again(self, client):
         """Test that a user can sign up again after unregistering"""
         email = "james@mergington.edu"
         
-        # Unregister
-        response = client.post(f"/activities/Basketball/unregister?email={email}")
-        assert response.status_code == 200
+        # Arrange: user has already unregistered
+        activities["Basketball"]["participants"].remove(email)
         
         # Sign up again
-        response = client.post(f"/activities/Basketball/signup?email={email}")
+        response = client.post(SIGNUP_URL.format("Basketball"), params={"email": email})
         assert response.status_code == 200
         
         # Verify participant is back
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Basketball"]["participants"]
+        assert email in activities["Basketball"]["participants"]
 
 
 class TestIntegration:
@@ -214,25 +200,22 @@ class TestIntegration:
         activity = "Soccer"
         
         # Get initial count
-        response = client.get("/activities")
-        initial_count = len(response.json()[activity]["participants"])
+        initial_count = len(activities[activity]["participants"])
         
         # Sign up
-        response = client.post(f"/activities/{activity}/signup?email={email}")
+        response = client.post(SIGNUP_URL.format(activity), params={"email": email})
         assert response.status_code == 200
         
         # Check count increased
-        response = client.get("/activities")
-        new_count = len(response.json()[activity]["participants"])
+        new_count = len(activities[activity]["participants"])
         assert new_count == initial_count + 1
         
         # Unregister
-        response = client.post(f"/activities/{activity}/unregister?email={email}")
+        response = client.post(UNREGISTER_URL.format(activity), params={"email": email})
         assert response.status_code == 200
         
         # Check count decreased
-        response = client.get("/activities")
-        final_count = len(response.json()[activity]["participants"])
+        final_count = len(activities[activity]["participants"])
         assert final_count == initial_count
     
     def test_multiple_activities_independent(self, client):
@@ -240,13 +223,10 @@ class TestIntegration:
         email = "test@mergington.edu"
         
         # Sign up to two different activities
-        client.post(f"/activities/Basketball/signup?email={email}")
-        client.post(f"/activities/Soccer/signup?email={email}")
-        
-        response = client.get("/activities")
-        data = response.json()
+        client.post(SIGNUP_URL.format("Basketball"), params={"email": email})
+        client.post(SIGNUP_URL.format("Soccer"), params={"email": email})
         
         # Verify in both
-        assert email in data["Basketball"]["participants"]
-        assert email in data["Soccer"]["participants"]
-        assert email not in data["Art Club"]["participants"]
+        assert email in activities["Basketball"]["participants"]
+        assert email in activities["Soccer"]["participants"]
+        assert email not in activities["Art Club"]["participants"]